@@ -12,31 +12,34 @@ def format_rows(rows: List[Row]) -> str:
     if not rows:
         return "(0 rows)"
 
-    # Get the union of all keys (columns) in order of first appearance
-    cols: List[str] = []
+    # Union of all keys (columns) in order of first appearance. dict keys are
+    # ordered and deduplicate with hashing, so this stays O(rows * cols);
+    # rows from Table.select all share one schema, making the first update a
+    # no-op for the rest.
+    cols_dict: dict = {}
     for row in rows:
-        for k in row.keys():
-            if k not in cols:
-                cols.append(k)
+        cols_dict.update(dict.fromkeys(row))
+    cols: List[str] = list(cols_dict)
 
-    # Compute column widths
     def cell_str(v: Any) -> str:
         return "" if v is None else str(v)
 
-    col_widths = {c: len(c) for c in cols}
-    for row in rows:
-        for c in cols:
-            col_widths[c] = max(col_widths[c], len(cell_str(row.get(c))))
+    # Stringify every cell exactly once, then compute each column's width with
+    # max/map(len) over the cached strings (the loop runs in C builtins).
+    cell_strings = [[cell_str(row.get(c)) for c in cols] for row in rows]
+    col_widths = [
+        max(len(c), max(len(cells[j]) for cells in cell_strings))
+        for j, c in enumerate(cols)
+    ]
 
     # Header
-    header = " | ".join(c.ljust(col_widths[c]) for c in cols)
-    sep = "-+-".join("-" * col_widths[c] for c in cols)
+    header = " | ".join(c.ljust(w) for c, w in zip(cols, col_widths))
+    sep = "-+-".join("-" * w for w in col_widths)
     lines = [header, sep]
 
     # Rows
-    for row in rows:
-        line = " | ".join(cell_str(row.get(c)).ljust(col_widths[c]) for c in cols)
-        lines.append(line)
+    for cells in cell_strings:
+        lines.append(" | ".join(s.ljust(w) for s, w in zip(cells, col_widths)))
 
     lines.append(f"({len(rows)} rows)")
     return "\n".join(lines)
@@ -45,17 +48,26 @@ def repl() -> None:
     db = Database()
     engine = Engine(db)
 
-    print("MiniDB - tiny educational database")
-    print("Type SQL and end with ';'. Ctrl-D to exit.")
+    # input() goes through readline on every call; when stdin is piped we can
+    # read block-buffered lines directly and skip prompts entirely.
+    interactive = sys.stdin.isatty()
+    if interactive:
+        print("MiniDB - tiny educational database")
+        print("Type SQL and end with ';'. Ctrl-D to exit.")
     buffer = ""
 
     while True:
-        try:
-            prompt = "MiniDB> " if not buffer else "    ...> "
-            line = input(prompt)
-        except EOFError:
-            print()
-            break
+        if interactive:
+            try:
+                prompt = "MiniDB> " if not buffer else "    ...> "
+                line = input(prompt)
+            except EOFError:
+                print()
+                break
+        else:
+            line = sys.stdin.readline()
+            if not line:
+                break
 
         buffer += line.strip() + " "
         if ";" not in buffer:
@@ -71,7 +83,9 @@ def repl() -> None:
             if result is None:
                 print("OK")
             else:
-                print(format_rows(result))
+                # One buffered write for the whole result block rather than
+                # handing print a multi-line string plus a separate newline.
+                sys.stdout.write(format_rows(result) + "\n")
         except Exception as exc:  # noqa: BLE001
             print(f"Error: {exc}")
 
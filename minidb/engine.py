@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from .database import Database
 from .parser import (
@@ -17,15 +17,20 @@ class Engine:
 
     def __init__(self, db: Database) -> None:
         self.db = db
+        # One dict lookup on type(stmt) instead of an isinstance chain that
+        # grows with every statement kind.
+        self._dispatch: Dict[type, Callable[[Any], Optional[List[Row]]]] = {
+            CreateTableStmt: self._exec_create_table,
+            InsertStmt: self._exec_insert,
+            SelectStmt: self._exec_select,
+        }
 
     def execute(self, stmt: Statement) -> Optional[List[Row]]:
-        if isinstance(stmt, CreateTableStmt):
-            return self._exec_create_table(stmt)
-        if isinstance(stmt, InsertStmt):
-            return self._exec_insert(stmt)
-        if isinstance(stmt, SelectStmt):
-            return self._exec_select(stmt)
-        raise TypeError(f"Unsupported statement type: {type(stmt)!r}")
+        try:
+            handler = self._dispatch[type(stmt)]
+        except KeyError:
+            raise TypeError(f"Unsupported statement type: {type(stmt)!r}") from None
+        return handler(stmt)
 
     # --- Handlers -------------------------------------------------------------
 
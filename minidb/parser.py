@@ -1,20 +1,21 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 from .types import ColumnDef, ColumnType, Value
 
 # --- Tokenizer -----------------------------------------------------------------
 
-@dataclass(slots=True)
-class Token:
-    kind: str
-    text: str
+# Tokens are plain (kind, text) tuples: cheaper to allocate than objects, and
+# the kind strings are interned so parser comparisons are pointer compares.
+Token = Tuple[str, str]
 
-    def upper(self) -> str:
-        return self.text.upper()
+# Reserved words get their own KEYWORD kind at tokenize time, with the text
+# stored in canonical uppercase, so the parser never has to re-uppercase.
+_KEYWORDS = frozenset({"CREATE", "TABLE", "INSERT", "INTO", "VALUES", "SELECT", "FROM"})
 
 _TOKEN_REGEX = re.compile(
     r"""
@@ -34,22 +35,27 @@ _TOKEN_REGEX = re.compile(
 def tokenize(sql: str) -> List[Token]:
     tokens: List[Token] = []
     pos = 0
-    while pos < len(sql):
-        match = _TOKEN_REGEX.match(sql, pos)
-        if not match:
+    # finditer keeps the scan loop inside the C regex engine; we only check
+    # that consecutive matches are adjacent to catch illegal characters.
+    for match in _TOKEN_REGEX.finditer(sql):
+        if match.start() != pos:
             raise SyntaxError(f"Unexpected character at position {pos}: {sql[pos]!r}")
-        kind = match.lastgroup
-        text = match.group(0)
         pos = match.end()
-
+        kind = match.lastgroup
         if kind == "WS":
             continue
+        text = match.group(0)
         if kind == "STRING":
             # Strip the surrounding quotes
-            inner = match.group(2)  # the ([^']*) group
-            tokens.append(Token("STRING", inner))
-        else:
-            tokens.append(Token(kind, text))
+            text = text[1:-1]
+        elif kind == "IDENT":
+            upper = text.upper()
+            if upper in _KEYWORDS:
+                kind = "KEYWORD"
+                text = sys.intern(upper)
+        tokens.append((sys.intern(kind), text))
+    if pos != len(sql):
+        raise SyntaxError(f"Unexpected character at position {pos}: {sql[pos]!r}")
     return tokens
 
 # --- AST definitions -----------------------------------------------------------
@@ -74,40 +80,51 @@ Statement = Union[CreateTableStmt, InsertStmt, SelectStmt]
 # --- Parser helpers ------------------------------------------------------------
 
 class Parser:
+    # The helpers below read self.tokens/self.pos into locals and avoid
+    # calling each other: at one helper call per token, the bound-method
+    # dispatch and repeated attribute loads are the dominant cost.
+
     def __init__(self, tokens: List[Token]):
         self.tokens = tokens
         self.pos = 0
+        self._len = len(tokens)
 
     def _peek(self) -> Optional[Token]:
-        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+        pos = self.pos
+        return self.tokens[pos] if pos < self._len else None
 
     def _match(self, kind: str, text_upper: Optional[str] = None) -> Token:
-        tok = self._peek()
-        if tok is None:
+        pos = self.pos
+        if pos >= self._len:
             raise SyntaxError(f"Expected {kind}, got end of input")
-        if tok.kind != kind:
-            raise SyntaxError(f"Expected {kind}, got {tok.kind} ({tok.text!r})")
-        if text_upper is not None and tok.upper() != text_upper:
-            raise SyntaxError(f"Expected {text_upper}, got {tok.text!r}")
-        self.pos += 1
+        tok = self.tokens[pos]
+        if tok[0] != kind:
+            raise SyntaxError(f"Expected {kind}, got {tok[0]} ({tok[1]!r})")
+        if text_upper is not None and tok[1].upper() != text_upper:
+            raise SyntaxError(f"Expected {text_upper}, got {tok[1]!r}")
+        self.pos = pos + 1
         return tok
 
     def _match_keyword(self, keyword: str) -> Token:
-        tok = self._peek()
-        if tok is None or tok.kind != "IDENT" or tok.upper() != keyword:
-            raise SyntaxError(f"Expected keyword {keyword}, got {tok.text if tok else 'EOF'}")
-        self.pos += 1
+        pos = self.pos
+        if pos >= self._len:
+            raise SyntaxError(f"Expected keyword {keyword}, got EOF")
+        tok = self.tokens[pos]
+        if tok[0] != "KEYWORD" or tok[1] != keyword:
+            raise SyntaxError(f"Expected keyword {keyword}, got {tok[1]}")
+        self.pos = pos + 1
         return tok
 
     def _optional(self, kind: str, text_upper: Optional[str] = None) -> Optional[Token]:
-        tok = self._peek()
-        if tok is None:
+        pos = self.pos
+        if pos >= self._len:
             return None
-        if tok.kind != kind:
+        tok = self.tokens[pos]
+        if tok[0] != kind:
             return None
-        if text_upper is not None and tok.upper() != text_upper:
+        if text_upper is not None and tok[1].upper() != text_upper:
             return None
-        self.pos += 1
+        self.pos = pos + 1
         return tok
 
     # --- Statement parsers -----------------------------------------------------
@@ -116,21 +133,20 @@ class Parser:
         tok = self._peek()
         if tok is None:
             raise SyntaxError("Empty input")
-        if tok.kind == "IDENT":
-            upper = tok.upper()
-            if upper == "CREATE":
+        if tok[0] == "KEYWORD":
+            if tok[1] == "CREATE":
                 return self._parse_create_table()
-            if upper == "INSERT":
+            if tok[1] == "INSERT":
                 return self._parse_insert()
-            if upper == "SELECT":
+            if tok[1] == "SELECT":
                 return self._parse_select()
-        raise SyntaxError(f"Unknown statement starting with {tok.text!r}")
+        raise SyntaxError(f"Unknown statement starting with {tok[1]!r}")
 
     def _parse_create_table(self) -> CreateTableStmt:
         self._match_keyword("CREATE")
         self._match_keyword("TABLE")
         name_tok = self._match("IDENT")
-        table_name = name_tok.text
+        table_name = name_tok[1]
 
         self._match("LPAREN")
         columns: List[ColumnDef] = []
@@ -139,8 +155,8 @@ class Parser:
             col_name_tok = self._match("IDENT")
             type_tok = self._match("IDENT")
             col_def = ColumnDef(
-                name=col_name_tok.text,
-                col_type=ColumnType.from_sql(type_tok.text),
+                name=col_name_tok[1],
+                col_type=ColumnType.from_sql(type_tok[1]),
             )
             columns.append(col_def)
 
@@ -157,7 +173,7 @@ class Parser:
         self._match_keyword("INSERT")
         self._match_keyword("INTO")
         table_tok = self._match("IDENT")
-        table_name = table_tok.text
+        table_name = table_tok[1]
 
         self._match_keyword("VALUES")
         self._match("LPAREN")
@@ -168,14 +184,14 @@ class Parser:
             if tok is None:
                 raise SyntaxError("Unexpected end of input in VALUES list")
 
-            if tok.kind == "NUMBER":
+            if tok[0] == "NUMBER":
                 self.pos += 1
-                values.append(int(tok.text))
-            elif tok.kind == "STRING":
+                values.append(int(tok[1]))
+            elif tok[0] == "STRING":
                 self.pos += 1
-                values.append(tok.text)
+                values.append(tok[1])
             else:
-                raise SyntaxError(f"Expected NUMBER or STRING literal, got {tok.kind} ({tok.text!r})")
+                raise SyntaxError(f"Expected NUMBER or STRING literal, got {tok[0]} ({tok[1]!r})")
 
             if self._optional("COMMA") is not None:
                 continue
@@ -193,14 +209,14 @@ class Parser:
         if tok is None:
             raise SyntaxError("Unexpected end after SELECT")
 
-        if tok.kind == "STAR":
+        if tok[0] == "STAR":
             self.pos += 1
             columns = None
         else:
             cols: List[str] = []
             while True:
                 ident_tok = self._match("IDENT")
-                cols.append(ident_tok.text)
+                cols.append(ident_tok[1])
                 if self._optional("COMMA") is not None:
                     continue
                 break
@@ -208,7 +224,7 @@ class Parser:
 
         self._match_keyword("FROM")
         table_tok = self._match("IDENT")
-        table_name = table_tok.text
+        table_name = table_tok[1]
 
         self._optional("SEMICOLON")
         return SelectStmt(table_name=table_name, columns=columns)
@@ -220,5 +236,5 @@ def parse(sql: str) -> Statement:
     # Ensure no trailing junk
     if parser._peek() is not None:
         extra = parser._peek()
-        raise SyntaxError(f"Unexpected token after statement: {extra.text!r}")
+        raise SyntaxError(f"Unexpected token after statement: {extra[1]!r}")
     return stmt
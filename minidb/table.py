@@ -1,35 +1,86 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import Dict, List, Iterable, Optional
+from typing import Callable, Dict, List, Iterable, Optional, Tuple, Union
 
-from .types import ColumnDef, Value
+from .types import ColumnDef, ColumnType, Value
 
 Row = Dict[str, Value]
 
+# A column is either a typed array.array (unboxed C storage for fixed-width
+# types) or a plain list (TEXT, or any column that has received a NULL).
+ColumnStorage = Union["array[int]", List[Value]]
+
+_TYPE_CODES = {
+    ColumnType.INT: "q",   # signed 8-byte integer
+    ColumnType.BOOL: "B",  # 0/1 byte; values read back as ints
+}
+
+def _storage_for(col: ColumnDef) -> ColumnStorage:
+    typecode = _TYPE_CODES.get(col.col_type)
+    return array(typecode) if typecode else []
+
+# Compiled projectors, keyed by the tuple of projected column names. The
+# projection shape is fixed for a whole query, so we generate a function whose
+# body is a literal dict display over zipped columns once and reuse it; the
+# hot loop then carries no per-row name lookups. Column names are embedded via
+# repr, so arbitrary strings are safe.
+_PROJECTOR_CACHE: Dict[Tuple[str, ...], Callable[..., List[Row]]] = {}
+
+def _projector(names: Tuple[str, ...]) -> Callable[..., List[Row]]:
+    proj = _PROJECTOR_CACHE.get(names)
+    if proj is None:
+        args = ", ".join(f"c{i}" for i in range(len(names)))
+        vals = ", ".join(f"v{i}" for i in range(len(names)))
+        item = ", ".join(f"{name!r}: v{i}" for i, name in enumerate(names))
+        source = f"lambda {args}: [{{{item}}} for ({vals},) in zip({args})]"
+        proj = _PROJECTOR_CACHE[names] = eval(source)  # noqa: S307
+    return proj
+
 @dataclass
 class Table:
     name: str
     columns: List[ColumnDef]
-    _rows: List[Row] = field(default_factory=list)
+    # Column-oriented storage (struct-of-arrays): one value container per
+    # column instead of one dict per row. Inserts append into each column;
+    # rows only materialize as dicts when scanned/selected. INT/BOOL columns
+    # live in array.array so values are stored unboxed (8 bytes / 1 byte each
+    # instead of full PyObjects).
+    _cols: List[ColumnStorage] = field(init=False, repr=False)
+    _col_index: Dict[str, int] = field(init=False, repr=False)
+    _column_names: List[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._cols = [_storage_for(c) for c in self.columns]
+        self._col_index = {c.name: i for i, c in enumerate(self.columns)}
+        self._column_names = [c.name for c in self.columns]
 
     @property
     def column_names(self) -> List[str]:
-        return [c.name for c in self.columns]
+        return self._column_names
 
     def insert_row(self, values: List[Value]) -> None:
         if len(values) != len(self.columns):
             raise ValueError(
                 f"Expected {len(self.columns)} values, got {len(values)}"
             )
-        row: Row = {}
-        for col, val in zip(self.columns, values):
-            row[col.name] = val
-        self._rows.append(row)
+        for i, val in enumerate(values):
+            col = self._cols[i]
+            try:
+                col.append(val)
+            except (TypeError, OverflowError):
+                # A NULL, an out-of-range int, or an otherwise untyped value
+                # cannot live in a typed array; demote the column to a plain
+                # list and retry.
+                self._cols[i] = col = list(col)
+                col.append(val)
 
     def scan(self) -> Iterable[Row]:
-        """Return an iterable over all rows (no filtering yet)."""
-        return iter(self._rows)
+        """Yield all rows as dicts (no filtering yet)."""
+        names = self._column_names
+        for vals in zip(*self._cols):
+            yield dict(zip(names, vals))
 
     def select(
         self,
@@ -42,12 +93,17 @@ class Table:
         if column_names is None:
             return list(self.scan())
 
-        missing = [c for c in column_names if c not in self.column_names]
+        missing = [c for c in column_names if c not in self._col_index]
         if missing:
             raise KeyError(f"Unknown columns in SELECT: {missing}")
 
-        result: List[Row] = []
-        for row in self.scan():
-            projected = {col: row[col] for col in column_names}
-            result.append(projected)
-        return result
+        if not column_names:
+            # The grammar can't produce an empty projection, but select() is
+            # public API: return one empty dict per row instead of asking the
+            # codegen for a zero-column lambda (which wouldn't be valid
+            # syntax).
+            row_count = len(self._cols[0]) if self._cols else 0
+            return [{} for _ in range(row_count)]
+
+        selected = [self._cols[self._col_index[c]] for c in column_names]
+        return _projector(tuple(column_names))(*selected)
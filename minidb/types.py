@@ -11,13 +11,16 @@ class ColumnType(str, Enum):
 
     @classmethod
     def from_sql(cls, type_name: str) -> "ColumnType":
-        upper = type_name.upper()
         try:
-            return cls[upper]
+            return _SQL_TYPE_MAP[type_name.upper()]
         except KeyError:
             raise ValueError(f"Unsupported column type: {type_name!r}") from None
 
 
+# Plain dict beats EnumMeta.__getitem__ (metaclass dispatch) on the parse path.
+_SQL_TYPE_MAP = {member.name: member for member in ColumnType}
+
+
 Value = Union[int, str, bool, None]
 
 